@@ -1,4 +1,17 @@
-from .analyxer import Analyxer
+from typing import TYPE_CHECKING
 
 __version__ = "0.1.0"
 __author__ = "Francisco José Mata Aroco"
+
+if TYPE_CHECKING:
+    from .analyxer import Analyxer
+
+
+def __getattr__(name: str):
+    """import the Analyxer lazily (PEP 562) on its first access"""
+    # pylint: disable=import-outside-toplevel
+    if name == "Analyxer":
+        from .analyxer import Analyxer
+        globals()["Analyxer"] = Analyxer  # Next accesses skip __getattr__
+        return Analyxer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,12 @@
 """Analyser"""
-from typing import List, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 from pathlib import Path
 import datetime
+import fnmatch
 import shutil
+import re
 import os
 
 from kjmarotools import proprietdin
@@ -11,6 +14,57 @@ from kjmarotools.basics import filetools, conventions, logtools, ostools
 
 from . import metamgr, propinfo
 
+# ----------------------------------------------------------------------------
+# Single-match pre-filter of the file name conventions. Each group is a
+# superset of the names accepted by its convention (None -> it can not match)
+# as checked in tests/test_analyxer.py for the kjmarotools versions allowed
+# - kdin:   YYYYMMDD-HHMMSS*                    (conventions.is_file_kdin)
+# - ekdin:  *++YYYY-MM-DD+HH-MM-SS++*           (conventions.is_file_ekdin)
+# - prpdin: _DIN_PROPRIETARY_CANDIDATES names   (proprietdin classes)
+# ----------------------------------------------------------------------------
+_DIN_CANDIDATES = re.compile(
+    r"(?=(?P<kdin>.{8}-.{6}))?"
+    r"(?=(?P<ekdin>.*\+\+.*\+\+))?"
+    r"(?=(?P<prpdin>IMG_.{8}_.{6}"
+    r"|.{4}-.{2}-.{2} .{2}\..{2}\..{2}"
+    r"|WhatsApp Image .{4}-.{2}-.{8}\..{2}\..{2}))?", re.DOTALL)
+_DIN_PROPRIETARY_CANDIDATES = ("GooglePhotos", "Screenshot", "Whatsapp")
+
+
+def _fast_copy2(src: Path, dst: Path) -> None:
+    """
+    --------------------------------------------------------------------------
+    Equivalent to shutil.copy2 but copying the data in kernel space when the
+    OS allows it (os.copy_file_range, then os.sendfile). If none of them is
+    available or they fail, shutil.copy2 is used.
+    --------------------------------------------------------------------------
+    """
+    copy_funcs = []
+    if hasattr(os, "copy_file_range"):
+        copy_funcs.append(lambda ifd, ofd, ofs, cnt: os.copy_file_range(
+            ifd, ofd, cnt, ofs, ofs))
+    if hasattr(os, "sendfile"):
+        copy_funcs.append(lambda ifd, ofd, ofs, cnt: os.sendfile(
+            ofd, ifd, ofs, cnt))
+
+    for copy_func in copy_funcs:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                offset = 0
+                while offset < size:
+                    sent = copy_func(fsrc.fileno(), fdst.fileno(), offset,
+                                     size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+            if offset == size:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            continue
+    shutil.copy2(src, dst)
+
 
 class Analyxer:
     """
@@ -31,9 +85,10 @@ class Analyxer:
     """
     # pylint: disable=too-many-instance-attributes
     TO_REVIEW_PATH = "Files to review"
-    SKIP_EXTENSIONS = ("DMG", "XSL", "XML", "TXT", "DOC", "DOCX", "PPT", "DB",
-                       "LNK", "GIF", "BUP", "IFO", "VOB", "MP3", "ODT", "RAR",
-                       "PDF", "RTF", "DS_STORE")
+    SKIP_EXTENSIONS = frozenset((
+        "DMG", "XSL", "XML", "TXT", "DOC", "DOCX", "PPT", "DB", "LNK", "GIF",
+        "BUP", "IFO", "VOB", "MP3", "ODT", "RAR", "PDF", "RTF", "DS_STORE"))
+    PROBE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
     def __init__(self, base_path2scan: Path, logger: Logger,
                  meta_loggers_path: Path,
@@ -53,9 +108,66 @@ class Analyxer:
 
         # Internal variables of the class
         self.files2analyse: List[propinfo.FileInfo] = []
+        self.__scan_entries: Dict[Path, os.DirEntry] = {}
+        self.__base_str = os.path.join(os.fspath(base_path2scan), "")
+        self.__folders_bounds: Dict[Path, Optional[Tuple[
+            datetime.datetime, datetime.datetime]]] = {}
         self.__phs = "[ALX] <NewModulePhase> "
         self.__res = "[ALX] <NewResultsBlock> "
 
+    def _folder_kdin_bounds(self, folder: Path) -> Optional[Tuple[
+            datetime.datetime, datetime.datetime]]:
+        """
+        ----------------------------------------------------------------------
+        Return the folder KDIN-bounds (None if the folder has not a valid
+        KDIN). The folder names are parsed once and shared by all the steps.
+        ----------------------------------------------------------------------
+        """
+        if folder not in self.__folders_bounds:
+            bounds = None
+            if conventions.is_folder_kdin(folder, self.year_bounds):
+                bounds = conventions.get_folder_kdin_bounds(folder,
+                                                            self.year_bounds)
+            self.__folders_bounds[folder] = bounds
+        return self.__folders_bounds[folder]
+
+    def _relative(self, file: Path) -> str:
+        """return the file path relative to base_path2scan as string"""
+        file_str = os.fspath(file)
+        if file_str.startswith(self.__base_str):
+            return file_str[len(self.__base_str):]
+        return str(file.relative_to(self.base_path2scan))
+
+    def _scan_tree(self, root: Path) -> Iterator[os.DirEntry]:
+        """
+        ----------------------------------------------------------------------
+        Yield the DirEntry of every file allocated in the <root> folders-tree
+        using os.scandir (the cached DirEntry type info avoids one stat() per
+        entry). As filetools.get_folders_tree + get_files_tree do:
+        - Only the <root> sub-folders matching fld_patterns are scanned (all
+          of them if no patterns are given)
+        - The files allocated directly in <root> are skipped
+        - Symlinked folders are not followed
+        ----------------------------------------------------------------------
+        """
+        assert root.is_absolute(), "'base_folder' must be an absolute path."
+        with os.scandir(root) as entries:
+            folders = [x for x in entries if x.is_dir(follow_symlinks=False)]
+        if self.fld_patterns:
+            folders = [x for x in folders if any(
+                fnmatch.fnmatch(x.name, ptn) for ptn in self.fld_patterns)]
+
+        while folders:
+            try:
+                with os.scandir(folders.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            folders.append(entry)
+                        elif entry.is_file():
+                            yield entry
+            except OSError:
+                continue  # Unreadable folders are skipped (as os.walk does)
+
     def load_files2analyse(self) -> None:
         """
         ----------------------------------------------------------------------
@@ -63,37 +175,59 @@ class Analyxer:
         fuerther analysis in the next steps
         ----------------------------------------------------------------------
         """
+        # pylint: disable=too-many-locals
         self.log.info(f"{self.__phs}Scanning files in path...")
-        folders2scan = filetools.get_folders_tree(self.base_path2scan,
-                                                  self.fld_patterns)
-        files_in_path = filetools.get_files_tree(folders2scan)
-
-        for file in files_in_path:
-            if file.name.upper().split(".")[-1] in self.SKIP_EXTENSIONS:
-                continue
-            if file.suffix[1:].upper() in self.SKIP_EXTENSIONS:
+        self.__scan_entries = {Path(x.path): x for x in
+                               self._scan_tree(self.base_path2scan)}
+
+        readable_exts = self.metadata_editor.readable_extensions
+        editable_exts = self.metadata_editor.editable_extensions
+        prp_names = {x.__name__ for x in
+                     proprietdin.BaseProprietary.__subclasses__()}
+        prp_prefilter = prp_names <= set(_DIN_PROPRIETARY_CANDIDATES)
+
+        finfos: List[propinfo.FileInfo] = []
+        for file in sorted(self.__scan_entries):
+            # The name tail also covers the suffix-less dot-files (.DS_Store)
+            if file.name.upper().rsplit(".", 1)[-1] in self.SKIP_EXTENSIONS:
                 continue
-
-            valid_mtadate = False
             suffix = file.suffix[1:].upper()
-            if suffix in self.metadata_editor.readable_extensions:
-                self.metadata_editor.load_file(file)
-                valid_mtadate = self.metadata_editor.has_valid_date_original()
-                if valid_mtadate:
-                    metadate_orig = self.metadata_editor.get_date_original()
-
-            finfo = propinfo.FileInfo(
-                conventions.is_file_kdin(file, self.year_bounds),
-                conventions.is_file_ekdin(file, self.year_bounds),
-                proprietdin.is_proprietary_din(file, self.year_bounds),
-                valid_mtadate,
-                suffix in self.metadata_editor.readable_extensions,
-                suffix in self.metadata_editor.editable_extensions,
-                file)
-
-            if valid_mtadate:
+
+            # The conventions are only evaluated for the possible candidates
+            din = _DIN_CANDIDATES.match(file.name)
+            assert din is not None  # Always matches (all groups optional)
+            is_kdin = din["kdin"] is not None and conventions.is_file_kdin(
+                file, self.year_bounds)
+            is_ekdin = din["ekdin"] is not None and conventions.is_file_ekdin(
+                file, self.year_bounds)
+            is_prpdin = (din["prpdin"] is not None or not prp_prefilter) and \
+                proprietdin.is_proprietary_din(file, self.year_bounds)
+            finfos.append(propinfo.FileInfo(
+                is_kdin, is_ekdin, is_prpdin, False,
+                suffix in readable_exts, suffix in editable_exts, file))
+
+        # ExifTool files are read in batch, the rest are probed per file.
+        # Metadata probing is I/O bound and independent per file -> threaded
+        # (editable EKDIN files keep the handle to be edited in a next step)
+        readable_files = [x for x in finfos if x.readable]
+        metadates: Dict[Path, Optional[datetime.datetime]] = dict(
+            self.metadata_editor.preload_dates_original(
+                [x.abs_path for x in readable_files]))
+        files2probe = [x for x in readable_files
+                       if x.abs_path not in metadates]
+        with ThreadPoolExecutor(max_workers=self.PROBE_WORKERS) as pool:
+            metadates.update(zip(
+                [x.abs_path for x in files2probe],
+                pool.map(self.metadata_editor.probe_date_original,
+                         [x.abs_path for x in files2probe],
+                         [x.ekdin and x.editable for x in files2probe])))
+
+        for finfo in finfos:
+            metadate_orig = metadates.get(finfo.abs_path)
+            if metadate_orig is not None:
+                finfo.metadte = True
                 finfo.set_metadate_original(metadate_orig)
-            self.files2analyse.append(finfo)
+        self.files2analyse.extend(finfos)
         inf_msg = f"{self.__res}Files found to be analyzed = %s"
         self.log.info(inf_msg, len(self.files2analyse))
 
@@ -108,24 +242,23 @@ class Analyxer:
         self.log.info(infmsg + " rename...")
         files_renamed: List[Path] = []
         files_existing: List[Path] = []
-        for idx, fileinfo in enumerate(self.files2analyse):
-
-            if fileinfo.prpdin:
-                original_path = fileinfo.abs_path
-                updated_info = propinfo.update_proprietary_din(fileinfo)
-                if updated_info.abs_path == original_path:
-                    files_existing.append(original_path)
-                else:
-                    self.files2analyse[idx] = updated_info
-                    files_renamed.append(updated_info.abs_path)
+        prop_files = [(idx, x) for idx, x in enumerate(self.files2analyse)
+                      if x.prpdin]
+        for idx, fileinfo in prop_files:
+            original_path = fileinfo.abs_path
+            updated_info = propinfo.update_proprietary_din(fileinfo)
+            if updated_info.abs_path == original_path:
+                files_existing.append(original_path)
+            else:
+                self.files2analyse[idx] = updated_info
+                files_renamed.append(updated_info.abs_path)
 
         if files_renamed:
             imsg = f"{self.__res}Files with proprietary date-in-name "
             imsg += "renamed = %s"
             self.log.info(imsg, len(files_renamed))
             for fle in files_renamed:
-                self.log.info("[ALX] [PropRenamed]: %s",
-                              str(fle.relative_to(self.base_path2scan)))
+                self.log.info("[ALX] [PropRenamed]: %s", self._relative(fle))
         if files_existing:
             imsg = f"{self.__res}Files not renamed because the renamed "
             imsg += "file already exists = %s"
@@ -134,7 +267,7 @@ class Analyxer:
                 self.log.warning(
                     "[ALX] [Duplicated] (%s): %s",
                     proprietdin.kdin_from_proprietary_din(fle).name,
-                    str(fle.relative_to(self.base_path2scan)))
+                    self._relative(fle))
         return files_existing
 
     def analyse_files_date_integrity(self) -> List[Path]:
@@ -147,12 +280,10 @@ class Analyxer:
         self.log.info(f"{self.__phs}Checking file-dates integrity...")
         files_damaged: List[Path] = []
         files_date2review: List[Path] = []
-        for idx, fileinfo in enumerate(self.files2analyse):
-            if fileinfo.kdin or fileinfo.ekdin:
-                continue
-            if fileinfo.metadte or fileinfo.prpdin:
-                continue
-
+        # Files without any KDIN, EKDIN, metadata-date or proprietary-DIN
+        files2check = [x for x in self.files2analyse
+                       if not (x.kdin or x.ekdin or x.metadte or x.prpdin)]
+        for fileinfo in files2check:
             # Try to extract damaged original dates from the metadata
             if fileinfo.readable:
                 abs_pth = fileinfo.abs_path
@@ -163,29 +294,32 @@ class Analyxer:
                     continue
 
             # Dates in risk -> Write TRKDIN (KDIN with Date-To-Review)
-            mdf_date = ostools.get_file_modify_date(fileinfo.abs_path)
+            entry = self.__scan_entries.get(fileinfo.abs_path)
+            if entry is not None:
+                mdf_date = datetime.datetime.fromtimestamp(
+                    entry.stat().st_mtime)
+            else:
+                mdf_date = ostools.get_file_modify_date(fileinfo.abs_path)
             new_name = conventions.file_clean2trkdin(fileinfo.abs_path,
                                                      mdf_date)
             os.rename(fileinfo.abs_path, new_name)
             files_date2review.append(new_name)
             fileinfo.abs_path = new_name
             fileinfo.kdin = True
-            self.files2analyse[idx] = fileinfo
 
         if files_damaged:
             imsg = f"{self.__res}Files with damaged metadata-date found = %s"
             self.log.warning(imsg, len(files_damaged))
             for fle in files_damaged:
                 self.log.warning("[ALX] [DateDamaged] (%s): %s", fle.name,
-                                 str(fle.parent.relative_to(
-                                     self.base_path2scan)))
+                                 self._relative(fle.parent))
         if files_date2review:
             imsg = f"{self.__res}Files with dates-to-review renamed and found"
             imsg += " = %s"
             self.log.warning(imsg, len(files_date2review))
             for fle in files_date2review:
                 self.log.warning("[ALX] [Date2Review]: %s",
-                                 str(fle.relative_to(self.base_path2scan)))
+                                 self._relative(fle))
         clean_files_damaged = [x.parent for x in files_damaged]
         return clean_files_damaged + files_date2review
 
@@ -206,57 +340,56 @@ class Analyxer:
         fld4f2rev_originals = folder2review.joinpath("originals")
         fld4f2rev_edited = folder2review.joinpath("edited")
 
+        ekdin_files = [x for x in self.files2analyse if x.ekdin]
+
+        # Create the folders only if any editable file is finally found
+        if any(x.editable for x in ekdin_files):
+            os.makedirs(fld4f2rev_originals, exist_ok=True)
+            os.makedirs(fld4f2rev_edited, exist_ok=True)
+
         meta_edited: List[Path] = []
         files_din_renamed: List[Path] = []
-        for idx, fileinfo in enumerate(self.files2analyse):
-            if fileinfo.ekdin:
-                if fileinfo.editable:
-                    # Create the folders if editable file is finally found
-                    os.makedirs(fld4f2rev_originals, exist_ok=True)
-                    os.makedirs(fld4f2rev_edited, exist_ok=True)
-
-                    # Move a copy of the file before the edition
-                    nme = fld4f2rev_originals.joinpath(fileinfo.abs_path.name)
-                    shutil.copy2(fileinfo.abs_path, nme)
-
-                    # Edit the metadata exif
-                    date2add = conventions.get_file_ekdin(fileinfo.abs_path,
-                                                          self.year_bounds)
-                    self.metadata_editor.load_file(fileinfo.abs_path)
-                    self.metadata_editor.set_date_original(date2add)
-                    self.metadata_editor.save_file()
-
-                    # Move a copy of the new file
-                    nme = fld4f2rev_edited.joinpath(fileinfo.abs_path.name)
-                    shutil.copy2(fileinfo.abs_path, nme)
-
-                    # Rename the file edited
-                    new_rnme = filetools.itername(
-                        conventions.file_ekdin2clean(fileinfo.abs_path))
-                    os.rename(fileinfo.abs_path, new_rnme)
-                    meta_edited.append(new_rnme)
-                    fileinfo.metadte = True
-                    fileinfo.ekdin = False
-                    fileinfo.abs_path = new_rnme
-                    fileinfo.set_metadate_original(date2add)
-                    self.files2analyse[idx] = fileinfo
-                    continue
-
-                new_rnme = filetools.itername(conventions.file_ekdin2kdin(
-                    fileinfo.abs_path, self.year_bounds))
-                os.rename(fileinfo.abs_path, new_rnme)
-                files_din_renamed.append(new_rnme)
-                fileinfo.abs_path = new_rnme
+        for fileinfo in ekdin_files:
+            if fileinfo.editable:
+                # Move a copy of the file before the edition
+                nme = fld4f2rev_originals.joinpath(fileinfo.abs_path.name)
+                _fast_copy2(fileinfo.abs_path, nme)
+
+                # Edit the metadata exif
+                date2add = conventions.get_file_ekdin(fileinfo.abs_path,
+                                                      self.year_bounds)
+                self.metadata_editor.load_file(fileinfo.abs_path)
+                self.metadata_editor.set_date_original(date2add)
+                self.metadata_editor.save_file()
+
+                # Move a copy of the new file
+                nme = fld4f2rev_edited.joinpath(fileinfo.abs_path.name)
+                _fast_copy2(fileinfo.abs_path, nme)
+
+                # Rename the file edited
+                new_rnme = filetools.itername(
+                    conventions.file_ekdin2clean(fileinfo.abs_path))
+                os.replace(fileinfo.abs_path, new_rnme)
+                meta_edited.append(new_rnme)
+                fileinfo.metadte = True
                 fileinfo.ekdin = False
-                fileinfo.kdin = True
-                self.files2analyse[idx] = fileinfo
+                fileinfo.abs_path = new_rnme
+                fileinfo.set_metadate_original(date2add)
+                continue
+
+            new_rnme = filetools.itername(conventions.file_ekdin2kdin(
+                fileinfo.abs_path, self.year_bounds))
+            os.replace(fileinfo.abs_path, new_rnme)
+            files_din_renamed.append(new_rnme)
+            fileinfo.abs_path = new_rnme
+            fileinfo.ekdin = False
+            fileinfo.kdin = True
 
         if files_din_renamed:
             imsg = f"{self.__res}Files with edition date-in-name renamed = %s"
             self.log.info(imsg, len(files_din_renamed))
             for fle in files_din_renamed:
-                self.log.info("[ALX] [EdinRenamed]: %s",
-                              str(fle.relative_to(self.base_path2scan)))
+                self.log.info("[ALX] [EdinRenamed]: %s", self._relative(fle))
         if meta_edited:
             imsg = f"{self.__res}Files with metadata date field edited = %s"
             self.log.warning(imsg, len(meta_edited))
@@ -266,8 +399,7 @@ class Analyxer:
             imsg += f"<{folder2review.name}> folder."
             self.log.warning(imsg)
             for fle in meta_edited:
-                self.log.info("[ALX] [Edin2Metadt]: %s",
-                              str(fle.relative_to(self.base_path2scan)))
+                self.log.info("[ALX] [Edin2Metadt]: %s", self._relative(fle))
         return files_din_renamed + meta_edited
 
     def analyse_files_date_consistency(self, margin_secs=60) -> List[Path]:
@@ -280,29 +412,25 @@ class Analyxer:
         """
         infmsg = f"{self.__phs}Scanning file Metadates and KDIN consistency"
         self.log.info(infmsg + "...")
-        inconsistent: List[Path] = []
-        for fileinfo in self.files2analyse:
-            if fileinfo.kdin and fileinfo.metadte:
-                meta_date = fileinfo.get_metadate_original()
-                kdin_date = conventions.get_file_kdin(fileinfo.abs_path,
-                                                      self.year_bounds)
-                if abs((meta_date - kdin_date).total_seconds()) > margin_secs:
-                    inconsistent.append(fileinfo.abs_path.joinpath(
-                        str(meta_date)))
+        inconsistent: List[Tuple[Path, datetime.datetime]] = []
+        files2check = [x for x in self.files2analyse if x.kdin and x.metadte]
+        for fileinfo in files2check:
+            meta_date = fileinfo.get_metadate_original()
+            kdin_date = conventions.get_file_kdin(fileinfo.abs_path,
+                                                  self.year_bounds)
+            if abs((meta_date - kdin_date).total_seconds()) > margin_secs:
+                inconsistent.append((fileinfo.abs_path, meta_date))
 
         if inconsistent:
             imsg = f"{self.__res}Files with inconsistent Metadates and KDIN "
             imsg += "detected = %s >>> (Metadata dates are given in the "
             imsg += "following list)"
             self.log.warning(imsg, len(inconsistent))
-            for fle in inconsistent:
-                dtt_fmt = r"%Y-%m-%d %H:%M:%S"
-                dttm = datetime.datetime.strptime(str(fle.name)[:19], dtt_fmt)
+            for fle, meta_date in inconsistent:
                 self.log.warning("[ALX] [Inconsistent] (%s): %s",
-                                 conventions.date2ekdin(dttm),
-                                 str(fle.parent.relative_to(
-                                     self.base_path2scan)))
-        return [x.parent for x in inconsistent]
+                                 conventions.date2ekdin(meta_date),
+                                 self._relative(fle))
+        return [x[0] for x in inconsistent]
 
     def detect_files_out_of_folder_date_bounds(self) -> List[Path]:
         """
@@ -321,11 +449,8 @@ class Analyxer:
         self.log.info(infmsg)
         discrepances: List[Path] = []
         for fileinfo in self.files2analyse:
-            folder_path = fileinfo.abs_path.parent
-
-            if conventions.is_folder_kdin(folder_path, self.year_bounds):
-                fld_bounds = conventions.get_folder_kdin_bounds(
-                    folder_path, self.year_bounds)
+            fld_bounds = self._folder_kdin_bounds(fileinfo.abs_path.parent)
+            if fld_bounds is not None:
                 if fileinfo.kdin:
                     kdn = conventions.get_file_kdin(fileinfo.abs_path,
                                                     self.year_bounds)
@@ -349,11 +474,11 @@ class Analyxer:
         if discrepances:
             imsg = f"{self.__res}Files with dates out of folder-bounds "
             imsg += "detected = %s"
-            self.log.warn(imsg, len(discrepances))
-            for fle in discrepances:
-                self.log.warning("[ALX] [OutOfBounds] (%s): %s", fle.name,
-                                 str(fle.parent.relative_to(
-                                     self.base_path2scan)))
+            self.log.warning(imsg, len(discrepances))
+            # Single log record (one handler dispatch), one tagged line each
+            self.log.warning("%s", "\n".join(
+                f"[ALX] [OutOfBounds] ({fle.name}): "
+                f"{self._relative(fle.parent)}" for fle in discrepances))
         return [x.parent for x in discrepances]
 
     def run(self, margin_secs=60, embedded=False) -> bool:
@@ -367,7 +492,8 @@ class Analyxer:
         self.log.info("[ALX] <INIT> Analyxer initialized ...")
         self.log.info(f"[ALX] <CNFG> base_path2scan = {self.base_path2scan}")
         self.log.info(f"[ALX] <CNFG> fld_patterns = {self.fld_patterns}")
-        self.log.info(f"[ALX] <CNFG> skip_extensions = {self.SKIP_EXTENSIONS}")
+        skip_exts = tuple(sorted(self.SKIP_EXTENSIONS))
+        self.log.info(f"[ALX] <CNFG> skip_extensions = {skip_exts}")
         self.log.info(f"[ALX] <CNFG> Review_folder = [{self.TO_REVIEW_PATH}]")
         self.log.info(f"[ALX] <CNFG> year_bounds = {self.year_bounds}")
         tgs0 = "[PropRenamed] [Duplicated] [DateDamaged] [Date2Review]"
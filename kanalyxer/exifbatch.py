@@ -0,0 +1,134 @@
+"""Batched ExifTool reader (single persistent exiftool process)"""
+from typing import Dict, List, Optional, Union
+from logging import Logger
+from pathlib import Path
+import subprocess
+import datetime
+import shutil
+import json
+import os
+
+
+class ExifToolBatch:
+    """
+    --------------------------------------------------------------------------
+    Keep a single 'exiftool -stay_open True -@ -' process alive and send it
+    the commands through stdin, instead of spawning one exiftool process per
+    file (the process startup dominates the per-file reading time).
+    - Usage: 'with ExifToolBatch() as batch: batch.get_dates_original(...)'
+    - logger: [optional] log the files read and the chunks not processed
+    --------------------------------------------------------------------------
+    """
+    SENTINEL = b"{ready}"
+    DATE_FORMAT = r"%Y:%m:%d %H:%M:%S"
+    FILES_PER_EXECUTE = 256  # Files sent on each '-execute' command
+
+    def __init__(self, executable: Optional[str] = None,
+                 logger: Optional[Logger] = None) -> None:
+        self._log = logger
+        executable = executable or self.find_executable()
+        assert executable is not None, "ExifTool executable not found"
+        # pylint: disable=consider-using-with
+        # The process lives as long as the object (finished by close())
+        self._proc = subprocess.Popen(
+            [executable, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL)
+
+    def __enter__(self) -> "ExifToolBatch":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    @staticmethod
+    def find_executable() -> Optional[str]:
+        """return the exiftool executable path (None if not found)"""
+        return shutil.which("exiftool")
+
+    @staticmethod
+    def is_single_line(arg: Union[str, "os.PathLike[str]"]) -> bool:
+        """return if the argument has no line breaks (one '-@' line)"""
+        arg_str = os.fspath(arg)
+        return "\n" not in arg_str and "\r" not in arg_str
+
+    def execute(self, *args: Union[str, "os.PathLike[str]"]) -> bytes:
+        """
+        ----------------------------------------------------------------------
+        Send the arguments as a single command and return its stdout. The
+        arguments are encoded as the OS file names are (os.fsencode), so the
+        non-UTF-8 names returned by os.scandir are sent byte by byte.
+        - ValueError if an argument has line breaks: exiftool reads one
+          argument per line, so it would be split into several arguments
+          (e.g. a file named 'x\\n-AllDates=...' would write the metadata)
+        ----------------------------------------------------------------------
+        """
+        assert self._proc.stdin is not None and self._proc.stdout is not None
+        for arg in args:
+            if not self.is_single_line(arg):
+                raise ValueError(f"Line break in exiftool argument: {arg!r}")
+        cmd = b"".join(os.fsencode(x) + b"\n" for x in args) + b"-execute\n"
+        self._proc.stdin.write(cmd)
+        self._proc.stdin.flush()
+
+        output: List[bytes] = []
+        for line in iter(self._proc.stdout.readline, b""):
+            if line.strip() == self.SENTINEL:
+                break
+            output.append(line)
+        return b"".join(output)
+
+    def get_dates_original(self, files: List[Path]
+                           ) -> Dict[Path, datetime.datetime]:
+        """
+        ----------------------------------------------------------------------
+        Return the metadata DateTimeOriginal of the given files. The files
+        without a DateTimeOriginal (or with an unparseable one) are not
+        included in the returned dict, neither the files of the chunks that
+        exiftool could not process.
+        ----------------------------------------------------------------------
+        """
+        by_name = {os.path.normcase(os.path.normpath(x)): x for x in files}
+        dates: Dict[Path, datetime.datetime] = {}
+        for idx in range(0, len(files), self.FILES_PER_EXECUTE):
+            chunk = files[idx:idx + self.FILES_PER_EXECUTE]
+            try:
+                output = self.execute("-charset", "filename=utf8", "-json",
+                                      "-DateTimeOriginal", *chunk)
+                items = json.loads(output.decode(
+                    "utf-8", "surrogateescape")) if output else []
+            except (OSError, UnicodeError, ValueError) as err:
+                if self._log is not None:
+                    self._log.warning("[ETB] %s files not read in batch: %s",
+                                      len(chunk), err)
+                continue
+
+            for item in items:
+                file = by_name.get(os.path.normcase(os.path.normpath(
+                    item.get("SourceFile", ""))))
+                date_str = str(item.get("DateTimeOriginal", ""))[:19]
+                if file is None or not date_str:
+                    continue
+                try:
+                    dates[file] = datetime.datetime.strptime(
+                        date_str, self.DATE_FORMAT)
+                except ValueError:
+                    pass
+
+            if self._log is not None:
+                for file in chunk:
+                    self._log.info("[ETB] File read (%s): %s",
+                                   dates.get(file, "No DateTimeOriginal"),
+                                   file)
+        return dates
+
+    def close(self) -> None:
+        """finish the exiftool process"""
+        if self._proc.poll() is None:
+            assert self._proc.stdin is not None
+            try:
+                self._proc.stdin.write(b"-stay_open\nFalse\n")
+                self._proc.stdin.flush()
+            except OSError:
+                pass
+            self._proc.communicate()
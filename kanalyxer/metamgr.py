@@ -1,11 +1,19 @@
 """Metadata manager for MediaOfficer"""
-from typing import Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from logging import Logger
 from pathlib import Path
 from enum import Enum
+import threading
 import datetime
+import os
 
 from kpilexifmanager import PilExifManager
 from kexiftoolmanager import ExifToolManager
+from kjmarotools.basics import logtools
+
+from .exifbatch import ExifToolBatch
 
 
 class MetaManager:
@@ -13,40 +21,56 @@ class MetaManager:
     --------------------------------------------------------------------------
     --------------------------------------------------------------------------
     """
+    # pylint: disable=too-many-instance-attributes
     class LoadId(Enum):
         """Enum for identify the current file loader"""
         PILLOW = 0
         EXIFTOOL = 1
 
+    EXIF_CACHE_SIZE = 256  # Max. Pillow handles kept by probe_date_original
+    EXIFTOOL_WORKERS = min(8, os.cpu_count() or 1)  # Max. exiftool processes
+
     def __init__(self, log_path: Path, year_bounds=(1800, 2300),
                  pilexif_log=True, pilexif_only=False) -> None:
         self._filepath: Optional[Path] = None
         self._load_id = self.LoadId.PILLOW
+        self._log_path = log_path
+        self._pilexif_log = pilexif_log
         self._exftool = ExifToolManager(logger=True, log_path=log_path)
         self._pilexif = PilExifManager(logger=pilexif_log, log_path=log_path)
+        self._workers = threading.local()  # Managers of probe_date_original
+        self._pilloaded = self._pilexif  # Pillow manager of the loaded file
+        self._exif_cache: "OrderedDict[Path, PilExifManager]" = OrderedDict()
+        self._exif_cache_lock = threading.Lock()
 
         exfdtc = self._exftool.exiftool_detected
         self._pilonly = pilexif_only if exfdtc else True
         self._year_bounds = year_bounds
 
+        # The extensions never change once loaded -> cached for O(1) lookups
+        read0 = self._pilexif.READABLE_EXTENSIONS
+        read1 = self._exftool.readable_extensions
+        edit0 = self._pilexif.EDITABLE_EXTENSIONS
+        edit1 = self._exftool.editable_extensions
+        self._readable_exts = frozenset(
+            read0 + (read1 if not self._pilonly else ()))
+        self._editable_exts = frozenset(
+            edit0 + (edit1 if not self._pilonly else ()))
+
     @property
     def pilexif_only(self) -> bool:
         """return if ExifToolManager is not being used"""
         return self._pilonly
 
     @property
-    def readable_extensions(self) -> Tuple[str]:
+    def readable_extensions(self) -> FrozenSet[str]:
         """return the MetaManager readable extensions"""
-        read0 = self._pilexif.READABLE_EXTENSIONS
-        read1 = self._exftool.readable_extensions
-        return read0 + (read1 if not self._pilonly else ())
+        return self._readable_exts
 
     @property
-    def editable_extensions(self) -> Tuple[str]:
+    def editable_extensions(self) -> FrozenSet[str]:
         """return the MetaManager editable extensions"""
-        edit0 = self._pilexif.EDITABLE_EXTENSIONS
-        edit1 = self._exftool.editable_extensions
-        return edit0 + (edit1 if not self._pilonly else ())
+        return self._editable_exts
 
     def file_has_damaged_date(self, file: Path) -> bool:
         """return if a possible damaged date is in the file metadata"""
@@ -85,8 +109,15 @@ class MetaManager:
         assert file.suffix[1:].upper() in self.readable_extensions
         self._filepath = file
         if file.suffix[1:].upper() in self._pilexif.READABLE_EXTENSIONS:
+            with self._exif_cache_lock:
+                cached = self._exif_cache.get(file)
+            if cached is not None:
+                self._load_id = self.LoadId.PILLOW
+                self._pilloaded = cached
+                return
             try:
                 self._load_id = self.LoadId.PILLOW
+                self._pilloaded = self._pilexif
                 self._pilexif.load_file(file)
                 return
             except ValueError as valerr:
@@ -98,9 +129,16 @@ class MetaManager:
     def save_file(self, overwrite=True) -> None:
         """save the file loaded"""
         if self._load_id == self.LoadId.PILLOW:
-            self._pilexif.save_file(overwrite=overwrite)
+            self._pilloaded.save_file(overwrite=overwrite)
         else:
             self._exftool.save_file(overwrite=overwrite)
+        self._evict_exif_cache(self._filepath)
+
+    def _evict_exif_cache(self, file: Optional[Path]) -> None:
+        """drop the cached Pillow handle of a file (its bytes changed)"""
+        if file is not None:
+            with self._exif_cache_lock:
+                self._exif_cache.pop(file, None)
 
     def has_valid_date_original(self) -> bool:
         """
@@ -110,15 +148,122 @@ class MetaManager:
         ----------------------------------------------------------------------
         """
         if self._load_id == self.LoadId.PILLOW:
-            has_date = self._pilexif.has_date_original
+            has_date = self._pilloaded.has_date_original
         else:
             has_date = self._exftool.has_metadata_date_original
         if has_date:
-            date_original = self.get_date_original()
-            year0, year1 = self._year_bounds
-            return year0 <= date_original.year <= year1
+            return self._in_year_bounds(self.get_date_original())
         return False
 
+    def probe_date_original(self, file: Path, keep_handle=False
+                            ) -> Optional[datetime.datetime]:
+        """
+        ----------------------------------------------------------------------
+        Thread-safe equivalent of load_file() + has_valid_date_original() +
+        get_date_original(). The file is loaded in the metadata managers of
+        the current thread (the loaded-file state of the MetaManager is not
+        modified).
+        - Returns the original date or None if it is not valid
+        - keep_handle: keep the Pillow handle (LRU of EXIF_CACHE_SIZE) so the
+                       next load_file() of the file does not parse it again
+        ----------------------------------------------------------------------
+        """
+        suffix = file.suffix[1:].upper()
+        assert suffix in self.readable_extensions
+        pilexif, exftool = self._worker_managers()
+        if suffix in PilExifManager.READABLE_EXTENSIONS:
+            if keep_handle:  # The kept handle can not be reused by the thread
+                pilexif = PilExifManager(logger=self._pilexif_log,
+                                         log_path=self._log_path)
+            try:
+                pilexif.load_file(file)
+            except ValueError as valerr:
+                if self._pilonly:
+                    raise valerr
+            else:
+                if keep_handle:
+                    self._keep_exif_handle(file, pilexif)
+                if pilexif.has_date_original:
+                    date_original = pilexif.get_date_original()
+                    if self._in_year_bounds(date_original):
+                        return date_original
+                return None
+
+        exftool.load_file(file)
+        if exftool.has_metadata_date_original:
+            date_original = exftool.get_date_original()
+            if self._in_year_bounds(date_original):
+                return date_original
+        return None
+
+    def _worker_managers(self) -> Tuple[PilExifManager, ExifToolManager]:
+        """return the metadata managers of the current thread (built once)"""
+        managers = getattr(self._workers, "managers", None)
+        if managers is None:
+            managers = (PilExifManager(logger=self._pilexif_log,
+                                       log_path=self._log_path),
+                        ExifToolManager(logger=True, log_path=self._log_path))
+            self._workers.managers = managers
+        return managers
+
+    def preload_dates_original(self, files: List[Path]
+                               ) -> Dict[Path, datetime.datetime]:
+        """
+        ----------------------------------------------------------------------
+        Read in batch (persistent exiftool processes) the DateTimeOriginal
+        of the given files that load_file() would load through ExifTool.
+        - Returns only the valid dates found (in the year_bounds configured)
+        - The files not returned must be probed with probe_date_original()
+        - The files with line breaks in its path are not read in batch (they
+          would be split into several exiftool arguments)
+        - The files read are logged in 'ExifToolBatch.log', next to the logs
+          of the metadata managers in log_path
+        - Up to EXIFTOOL_WORKERS processes are used in parallel (one for each
+          ExifToolBatch.FILES_PER_EXECUTE files)
+        ----------------------------------------------------------------------
+        """
+        if self._pilonly or ExifToolBatch.find_executable() is None:
+            return {}
+        exftool_files: List[Path] = []
+        for file in files:
+            suffix = file.suffix[1:].upper()
+            if suffix in self.readable_extensions and \
+                    suffix not in PilExifManager.READABLE_EXTENSIONS and \
+                    ExifToolBatch.is_single_line(file):
+                exftool_files.append(file)
+        if not exftool_files:
+            return {}
+        n_execs = -(-len(exftool_files) // ExifToolBatch.FILES_PER_EXECUTE)
+        workers = min(self.EXIFTOOL_WORKERS, n_execs)
+        batch_log = logtools.get_fast_logger("ExifToolBatch", self._log_path)
+        dates: Dict[Path, datetime.datetime] = {}
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for chunk_dates in pool.map(self._batch_dates_original, [
+                    exftool_files[idx::workers] for idx in range(workers)],
+                    [batch_log] * workers):
+                dates.update(chunk_dates)
+        return {k: v for k, v in dates.items() if self._in_year_bounds(v)}
+
+    @staticmethod
+    def _batch_dates_original(files: List[Path], logger: Logger
+                              ) -> Dict[Path, datetime.datetime]:
+        """read the DateTimeOriginal of the files in its own exiftool"""
+        with ExifToolBatch(logger=logger) as batch:
+            return batch.get_dates_original(files)
+
+    def _keep_exif_handle(self, file: Path, pilexif: PilExifManager) -> None:
+        """add the Pillow handle to the LRU cache dropping the oldest ones"""
+        with self._exif_cache_lock:
+            self._exif_cache[file] = pilexif
+            self._exif_cache.move_to_end(file)
+            while len(self._exif_cache) > self.EXIF_CACHE_SIZE:
+                self._exif_cache.popitem(last=False)
+
+    def _in_year_bounds(self, date: datetime.datetime) -> bool:
+        """return if the date is in the year_bounds configured"""
+        year0, year1 = self._year_bounds
+        return year0 <= date.year <= year1
+
     def get_date_original(self) -> datetime.datetime:
         """
         ----------------------------------------------------------------------
@@ -127,7 +272,7 @@ class MetaManager:
         ----------------------------------------------------------------------
         """
         if self._load_id == self.LoadId.PILLOW:
-            return self._pilexif.get_date_original()
+            return self._pilloaded.get_date_original()
         return self._exftool.get_date_original()
 
     def set_date_original(self, date2add: datetime.datetime) -> None:
@@ -140,13 +285,14 @@ class MetaManager:
             self._exftool.save_file(overwrite=True)
             return
 
-        suffix = self._pilexif._filepath.suffix[1:].upper()
+        self._evict_exif_cache(self._filepath)
+        suffix = self._pilloaded._filepath.suffix[1:].upper()
         if suffix in PilExifManager.EDITABLE_EXTENSIONS:
-            self._pilexif.set_date_original(date2add)
-            self._pilexif.save_file(overwrite=True)
+            self._pilloaded.set_date_original(date2add)
+            self._pilloaded.save_file(overwrite=True)
             return
 
         self._load_id = self.LoadId.EXIFTOOL
-        self._exftool.load_file(self._pilexif._filepath)
+        self._exftool.load_file(self._pilloaded._filepath)
         self._exftool.set_date_original(date2add)
         self._exftool.save_file(overwrite=True)
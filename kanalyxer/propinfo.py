@@ -27,6 +27,10 @@ class FileInfo:
     --------------------------------------------------------------------------
     """
     # pylint: disable=too-many-instance-attributes
+    # Slots instead of __dict__ (lighter and faster for large trees). The
+    # dataclass(slots=True) argument is not used to keep Python 3.9 support
+    __slots__ = ("kdin", "ekdin", "prpdin", "metadte", "readable", "editable",
+                 "abs_path", "_metadata_original_date")
     kdin: bool      # The file has Kjmaro date-in-name
     ekdin: bool     # The file has Kjmaro edit-date-in-name
     prpdin: bool    # The file has Proprietary edit-date-in-name
@@ -34,7 +38,9 @@ class FileInfo:
     readable: bool  # The file metadata is readable
     editable: bool  # The file metadata is editable
     abs_path: Path  # Absolute path of the file
-    _metadata_original_date = datetime.datetime(1, 1, 1)  # see __doc__
+
+    def __post_init__(self) -> None:
+        self._metadata_original_date = datetime.datetime(1, 1, 1)  # __doc__
 
     def set_metadate_original(self, date2add: datetime.datetime) -> None:
         """add the original metadate -> [self.metadte must be True]"""
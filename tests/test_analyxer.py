@@ -0,0 +1,97 @@
+"""Analyxer tests (against the kjmarotools functions it replaces)"""
+from typing import List
+from pathlib import Path
+import logging
+import os
+
+import pytest
+
+from kjmarotools import proprietdin
+from kjmarotools.basics import conventions, filetools
+
+from kanalyxer.analyxer import Analyxer, _DIN_CANDIDATES
+
+# Valid names of every file name convention (kdin, ekdin and proprietary)
+DIN_NAMES = (
+    "20210102-201005", "20210102-201005.jpg", "20210102-201005 test.jpg",
+    "20130502-235959(DTR) test2.jpg", "test++1999-01-16+12-21-02++one.jpg",
+    "test++1999-01-16+12-21-02++.jpg", "++1999-01-16+12-21-02++one.jpg",
+    "IMG_20190714_101010.jpg", "IMG_20190714_101010_1.jpg",
+    "2019-07-14 10.10.10.png", "2019-07-14 10.10.10 (1).png",
+    "WhatsApp Image 2019-07-14 at 10.10.10.jpeg",
+    "WhatsApp Image 2019-07-14 at 10.10.10 (1).jpeg")
+
+
+def make_analyxer(base: Path, patterns=()) -> Analyxer:
+    """return an Analyxer of <base> logging its metadata in a sibling dir"""
+    meta_logs = base.parent.joinpath("logs")
+    meta_logs.mkdir(exist_ok=True)
+    return Analyxer(base, logging.getLogger("test"), meta_logs, patterns)
+
+
+@pytest.fixture(name="tree")
+def fixture_tree(tmp_path: Path) -> Path:
+    """return a folders-tree with nested, dot, symlinked and base files"""
+    base = tmp_path.joinpath("base")
+    for folder in ("2001 trip/sub/deep", "2001-b", "misc/.hidden", "empty",
+                   ".dotfolder"):
+        base.joinpath(folder).mkdir(parents=True)
+    for file in ("top.jpg", "2001 trip/a.jpg", "2001 trip/.DS_Store",
+                 "2001 trip/sub/b.nef", "2001 trip/sub/deep/c", "2001-b/d.mp4",
+                 "misc/e.txt", "misc/.hidden/f.jpg", ".dotfolder/g.jpg"):
+        base.joinpath(file).write_text("")
+
+    outside = tmp_path.joinpath("outside")
+    outside.mkdir()
+    outside.joinpath("h.jpg").write_text("")
+    if hasattr(os, "symlink") and os.name != "nt":
+        base.joinpath("2001 link").symlink_to(outside)
+        base.joinpath("misc/link").symlink_to(outside)
+        base.joinpath("misc/i.jpg").symlink_to(outside.joinpath("h.jpg"))
+    return base
+
+
+@pytest.mark.parametrize("patterns", [
+    (), ("2001*",), ("*trip", "misc"), (".*",), ("no match*",)])
+def test_scan_tree_as_files_tree(tree: Path, patterns) -> None:
+    """_scan_tree finds the files get_folders_tree + get_files_tree find"""
+    # pylint: disable=protected-access
+    scanned = sorted(Path(x.path) for x in
+                     make_analyxer(tree, patterns)._scan_tree(tree))
+    expected = filetools.get_files_tree(
+        filetools.get_folders_tree(tree, patterns))
+    assert scanned == expected
+
+
+def test_scan_tree_relative_path(tree: Path) -> None:
+    """the base folder must be an absolute path (as get_folders_tree)"""
+    # pylint: disable=protected-access
+    analyxer = make_analyxer(tree)
+    with pytest.raises(AssertionError):
+        next(analyxer._scan_tree(Path(os.path.relpath(tree))))
+
+
+def mutated_names(name: str) -> List[str]:
+    """return the name with every single-character replace/insert/delete"""
+    chars = "019-_+. a(\n"
+    names = [name[:idx] + name[idx + 1:] for idx in range(len(name))]
+    for idx in range(len(name) + 1):
+        names += [name[:idx] + x + name[idx + 1:] for x in chars]
+        names += [name[:idx] + x + name[idx:] for x in chars]
+    return names
+
+
+@pytest.mark.parametrize("group, predicate", [
+    ("kdin", conventions.is_file_kdin),
+    ("ekdin", conventions.is_file_ekdin),
+    ("prpdin", proprietdin.is_proprietary_din)])
+def test_din_candidates_superset(group: str, predicate) -> None:
+    """every name accepted by a convention matches its pre-filter group"""
+    accepted = 0
+    for seed in DIN_NAMES:
+        for name in [seed] + mutated_names(seed):
+            if predicate(Path("/base/folder", name)):
+                accepted += 1
+                din = _DIN_CANDIDATES.match(name)
+                assert din is not None and din[group] is not None, name
+    assert accepted  # The conventions really accept the DIN_NAMES
@@ -0,0 +1,137 @@
+"""ExifToolBatch tests (against a fake stay_open exiftool)"""
+from pathlib import Path
+import datetime
+import logging
+import sys
+import os
+
+import pytest
+
+from kanalyxer.exifbatch import ExifToolBatch
+
+# Fake 'exiftool -stay_open True -@ -': the DateTimeOriginal of each file is
+# its content (no DateTimeOriginal if empty). File names are kept as bytes.
+# The arguments received are recorded in '<executable>.args'.
+FAKE_EXIFTOOL = r'''
+import sys
+files = []
+for line in sys.stdin.buffer:
+    with open(__file__ + ".args", "ab") as args:
+        args.write(line)
+    arg = line.rstrip(b"\n")
+    if arg == b"-stay_open":
+        break
+    if arg == b"-execute":
+        items = []
+        for name in files:
+            item = b'{"SourceFile": "' + name + b'"'
+            with open(name, "rb") as fle:
+                date = fle.read().strip()
+            if date:
+                item += b', "DateTimeOriginal": "' + date + b'"'
+            items.append(item + b"}")
+        sys.stdout.buffer.write(b"[" + b",\n".join(items) + b"]\n{ready}\n")
+        sys.stdout.buffer.flush()
+        files = []
+    elif not arg.startswith(b"-") and arg != b"filename=utf8":
+        files.append(arg)
+'''
+
+
+@pytest.fixture(name="fake_exiftool")
+def fixture_fake_exiftool(tmp_path: Path) -> str:
+    """return the path of the fake exiftool executable"""
+    script = tmp_path.joinpath("exiftool")
+    script.write_text(f"#!{sys.executable}\n{FAKE_EXIFTOOL}")
+    script.chmod(0o755)
+    return str(script)
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shebang fake exiftool")
+def test_get_dates_original(tmp_path: Path, fake_exiftool: str) -> None:
+    """valid, missing and unparseable dates"""
+    valid = tmp_path.joinpath("valid.nef")
+    valid.write_text("2001:02:03 04:05:06")
+    missing = tmp_path.joinpath("missing.nef")
+    missing.write_text("")
+    unparseable = tmp_path.joinpath("unparseable.nef")
+    unparseable.write_text("not a date")
+
+    with ExifToolBatch(fake_exiftool) as batch:
+        dates = batch.get_dates_original([valid, missing, unparseable])
+    assert dates == {valid: datetime.datetime(2001, 2, 3, 4, 5, 6)}
+
+
+@pytest.mark.skipif(sys.platform != "linux",
+                    reason="non-UTF-8 file names need a Linux file system")
+def test_get_dates_original_non_utf8(tmp_path: Path,
+                                     fake_exiftool: str) -> None:
+    """non-UTF-8 file names (surrogate escaped by os.scandir)"""
+    valid = tmp_path.joinpath("valid.nef")
+    valid.write_text("2001:02:03 04:05:06")
+    with open(os.path.join(os.fsencode(tmp_path), b"caf\xe9.nef"), "wb"
+              ) as fle:
+        fle.write(b"2002:03:04 05:06:07")
+    latin1 = next(Path(x.path) for x in os.scandir(tmp_path)
+                  if x.name.startswith("caf"))
+
+    with ExifToolBatch(fake_exiftool) as batch:
+        dates = batch.get_dates_original([valid, latin1])
+    assert dates == {valid: datetime.datetime(2001, 2, 3, 4, 5, 6),
+                     latin1: datetime.datetime(2002, 3, 4, 5, 6, 7)}
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shebang fake exiftool")
+def test_get_dates_original_failed_chunk(
+        tmp_path: Path, fake_exiftool: str,
+        monkeypatch: pytest.MonkeyPatch) -> None:
+    """the files of a chunk exiftool can not process are just not returned"""
+    valid = tmp_path.joinpath("valid.nef")
+    valid.write_text("2001:02:03 04:05:06")
+    deleted = tmp_path.joinpath("deleted.nef")  # Fake exiftool crashes
+
+    monkeypatch.setattr(ExifToolBatch, "FILES_PER_EXECUTE", 1)
+    with ExifToolBatch(fake_exiftool) as batch:
+        assert not batch.get_dates_original([deleted, valid])
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shebang fake exiftool")
+def test_execute_line_breaks(tmp_path: Path, fake_exiftool: str) -> None:
+    """the arguments with line breaks are never sent to exiftool"""
+    with ExifToolBatch(fake_exiftool) as batch:
+        for name in ("x\n-AllDates=1999:01:01 00:00:00\n.nef", "x\r.nef"):
+            with pytest.raises(ValueError):
+                batch.execute("-json", tmp_path.joinpath(name))
+    assert b"-AllDates" not in Path(fake_exiftool + ".args").read_bytes()
+    assert b"-json" not in Path(fake_exiftool + ".args").read_bytes()
+
+
+@pytest.mark.skipif(sys.platform != "linux",
+                    reason="line breaks in file names need a POSIX system")
+def test_get_dates_original_line_breaks(tmp_path: Path,
+                                        fake_exiftool: str) -> None:
+    """a file name with line breaks does not inject exiftool arguments"""
+    evil = tmp_path.joinpath("evil\n-AllDates=1999:01:01 00:00:00\n.nef")
+    evil.write_text("2001:02:03 04:05:06")
+
+    with ExifToolBatch(fake_exiftool) as batch:
+        assert not batch.get_dates_original([evil])
+    assert b"-AllDates" not in Path(fake_exiftool + ".args").read_bytes()
+
+
+@pytest.mark.skipif(os.name == "nt", reason="shebang fake exiftool")
+def test_get_dates_original_logged(tmp_path: Path, fake_exiftool: str,
+                                   caplog: pytest.LogCaptureFixture) -> None:
+    """every file read in batch is logged (as the ExifToolManager reads)"""
+    valid = tmp_path.joinpath("valid.nef")
+    valid.write_text("2001:02:03 04:05:06")
+    missing = tmp_path.joinpath("missing.nef")
+    missing.write_text("")
+
+    logger = logging.getLogger("test_exifbatch")
+    with caplog.at_level(logging.INFO, logger=logger.name):
+        with ExifToolBatch(fake_exiftool, logger=logger) as batch:
+            batch.get_dates_original([valid, missing])
+    assert [x.getMessage() for x in caplog.records] == [
+        f"[ETB] File read (2001-02-03 04:05:06): {valid}",
+        f"[ETB] File read (No DateTimeOriginal): {missing}"]